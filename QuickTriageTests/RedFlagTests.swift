@@ -0,0 +1,33 @@
+import Combine
+import XCTest
+@testable import QuickTriage
+
+final class RedFlagTests: XCTestCase {
+    // Runs a diagnosis through the model and waits for it to publish
+    private func diagnose(_ text: String, age: Int = 30) -> QuickTriageModel {
+        let model = QuickTriageModel()
+        model.symptomsText = text
+        model.age = age
+        let published = expectation(description: "diagnosis published")
+        let subscription = model.$results.dropFirst().sink { _ in published.fulfill() }
+        model.diagnose()
+        wait(for: [published], timeout: 5)
+        subscription.cancel()
+        return model
+    }
+
+    func testRedFlagsSurviveUnicodeSeparators() {
+        for text in ["chest pain", "chest\u{00A0}pain", "chest—pain", "faint—", "“unconscious”", "shortness of breath"] {
+            XCTAssertTrue(diagnose(text).isUrgent, text)
+        }
+    }
+
+    func testRedFlagsMatchWholeWordsOnly() {
+        XCTAssertFalse(diagnose("painful chest").isUrgent)
+    }
+
+    func testNonBreakingSpaceStillMatchesSymptom() {
+        let names = diagnose("chest\u{00A0}pain").results.map(\.name)
+        XCTAssertTrue(names.contains("Angina / Cardiac"), "\(names)")
+    }
+}
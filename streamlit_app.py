@@ -7,11 +7,332 @@ st.write(
 import SwiftUI
 
 // Simple condition model
-struct Condition: Identifiable {
+struct Condition: Identifiable, Equatable {
     let id = UUID()
     let name: String
     let confidence: Double // 0.0 - 1.0
     let summary: String
+    let confidenceText: String // formatted once here rather than on every view update
+
+    init(name: String, confidence: Double, summary: String) {
+        self.name = name
+        self.confidence = confidence
+        self.summary = summary
+        self.confidenceText = "\(Int(confidence * 100))%"
+    }
+}
+
+// Aho-Corasick automaton over lowercased ASCII keys, stored as a dense DFA.
+// Input bytes are first mapped to byte classes (one per distinct key byte, plus
+// class 0 for every other byte), so a node's row is only classCount wide and
+// the UInt16 table stays small enough to live in L1. Each input byte is a
+// single table lookup and a scan is O(text + hits).
+struct AhoCorasick {
+    let keys: [String]
+    private let byteClass: [UInt8]      // ASCII byte -> class
+    private let classCount: Int
+    private let next: [UInt16]          // nodeCount * classCount goto/transition table
+    private let outputStart: [UInt16]   // outputKeys[outputStart[n]..<outputStart[n + 1]] end at node n
+    private let outputKeys: [UInt16]
+
+    init<S: Sequence>(keys: S) where S.Element == String {
+        self.keys = Array(keys)
+
+        var byteClass = [UInt8](repeating: 0, count: 128)
+        var classCount = 1
+        for key in self.keys {
+            for b in key.utf8 where b < 128 && byteClass[Int(b)] == 0 {
+                byteClass[Int(b)] = UInt8(classCount)
+                classCount += 1
+            }
+        }
+
+        // build the trie
+        var next = [UInt16](repeating: 0, count: classCount)
+        var hasChild = [Bool](repeating: false, count: classCount)
+        var nodeOutputs: [[UInt16]] = [[]]
+        for (keyId, key) in self.keys.enumerated() {
+            var node = 0
+            for b in key.utf8 where b < 128 {
+                let slot = node * classCount + Int(byteClass[Int(b)])
+                if !hasChild[slot] {
+                    precondition(nodeOutputs.count <= Int(UInt16.max), "too many keys for UInt16 node ids")
+                    hasChild[slot] = true
+                    next[slot] = UInt16(nodeOutputs.count)
+                    next.append(contentsOf: repeatElement(0, count: classCount))
+                    hasChild.append(contentsOf: repeatElement(false, count: classCount))
+                    nodeOutputs.append([])
+                }
+                node = Int(next[slot])
+            }
+            nodeOutputs[node].append(UInt16(keyId))
+        }
+
+        // breadth-first pass: failure links, and fill missing gotos so scan never backtracks
+        var fail = [Int](repeating: 0, count: nodeOutputs.count)
+        var queue: [Int] = [0]
+        var head = 0
+        while head < queue.count {
+            let node = queue[head]
+            head += 1
+            for c in 0..<classCount {
+                let slot = node * classCount + c
+                if hasChild[slot] {
+                    let child = Int(next[slot])
+                    let f = node == 0 ? 0 : Int(next[fail[node] * classCount + c])
+                    fail[child] = f
+                    nodeOutputs[child] += nodeOutputs[f]
+                    queue.append(child)
+                } else if node != 0 {
+                    next[slot] = next[fail[node] * classCount + c]
+                }
+            }
+        }
+
+        var outputStart: [UInt16] = [0]
+        var outputKeys: [UInt16] = []
+        for outputs in nodeOutputs {
+            outputKeys += outputs
+            precondition(outputKeys.count <= Int(UInt16.max), "too many automaton outputs for UInt16 offsets")
+            outputStart.append(UInt16(outputKeys.count))
+        }
+
+        self.byteClass = byteClass
+        self.classCount = classCount
+        self.next = next
+        self.outputStart = outputStart
+        self.outputKeys = outputKeys
+    }
+
+    /// Calls `onMatch` with the key id of every key occurrence in `bytes`.
+    func scan<Bytes: Sequence>(_ bytes: Bytes, _ onMatch: (Int) -> Void) where Bytes.Element == UInt8 {
+        var node = 0
+        for b in bytes {
+            node = b < 128 ? Int(next[node * classCount + Int(byteClass[Int(b)])]) : 0
+            for i in Int(outputStart[node])..<Int(outputStart[node + 1]) {
+                onMatch(Int(outputKeys[i]))
+            }
+        }
+    }
+}
+
+// On-disk image of a built automaton, so launches can skip the build.
+// Layout, all little-endian:
+//   [magic, version, classCount, nodeCount: UInt32][keysFingerprint: UInt64]
+//   [byteClass: 128 x UInt8][next, outputStart, outputKeys: UInt16 each]
+extension AhoCorasick {
+    private static let magic: UInt32 = 0x4143_4654  // "ACFT"
+    private static let formatVersion: UInt32 = 1
+
+    // FNV-1a over the keys, so an image built from another key set is rejected
+    private static func fingerprint(_ keys: [String]) -> UInt64 {
+        var hash: UInt64 = 0xcbf29ce484222325
+        for key in keys {
+            for b in key.utf8 {
+                hash = (hash ^ UInt64(b)) &* 0x100000001b3
+            }
+            hash = hash &* 0x100000001b3  // key separator
+        }
+        return hash
+    }
+
+    func serialized() -> Data {
+        var data = Data()
+        func append<T: FixedWidthInteger>(_ value: T) {
+            withUnsafeBytes(of: value.littleEndian) { data.append(contentsOf: $0) }
+        }
+        append(Self.magic)
+        append(Self.formatVersion)
+        append(UInt32(classCount))
+        append(UInt32(outputStart.count - 1))
+        append(Self.fingerprint(keys))
+        data.append(contentsOf: byteClass)
+        for value in next { append(value) }
+        for value in outputStart { append(value) }
+        for value in outputKeys { append(value) }
+        return data
+    }
+
+    /// Restores an automaton for `keys` from `serialized()` output, or returns nil
+    /// if the image is from another format or key set, or is malformed.
+    init?(serialized data: Data, keys: [String]) {
+        var offset = data.startIndex
+        func read<T: FixedWidthInteger>(_ count: Int, of _: T.Type) -> [T]? {
+            let size = count * MemoryLayout<T>.size
+            guard count >= 0, data.endIndex - offset >= size else { return nil }
+            var values = [T](repeating: 0, count: count)
+            values.withUnsafeMutableBytes { _ = data.copyBytes(to: $0, from: offset..<offset + size) }
+            offset += size
+            return values.map(T.init(littleEndian:))
+        }
+
+        guard let header = read(4, of: UInt32.self),
+              header[0] == Self.magic, header[1] == Self.formatVersion,
+              let fingerprint = read(1, of: UInt64.self), fingerprint[0] == Self.fingerprint(keys)
+        else { return nil }
+        let classCount = Int(header[2]), nodeCount = Int(header[3])
+        guard (1...128).contains(classCount), nodeCount >= 1,
+              let byteClass = read(128, of: UInt8.self),
+              let next = read(nodeCount * classCount, of: UInt16.self),
+              let outputStart = read(nodeCount + 1, of: UInt16.self),
+              let outputKeys = read(Int(outputStart[nodeCount]), of: UInt16.self),
+              offset == data.endIndex,
+              byteClass.allSatisfy({ Int($0) < classCount }),
+              next.allSatisfy({ Int($0) < nodeCount }),
+              zip(outputStart, outputStart.dropFirst()).allSatisfy({ $0 <= $1 }),
+              outputKeys.allSatisfy({ Int($0) < keys.count })
+        else { return nil }
+
+        self.keys = keys
+        self.byteClass = byteClass
+        self.classCount = classCount
+        self.next = next
+        self.outputStart = outputStart
+        self.outputKeys = outputKeys
+    }
+
+    /// Loads the automaton for `keys` from `url`, building it and writing it
+    /// there when the file is missing or stale.
+    static func cached(keys: [String], at url: URL?) -> AhoCorasick {
+        guard let url = url else { return AhoCorasick(keys: keys) }
+        if let data = try? Data(contentsOf: url, options: .mappedIfSafe),
+           let automaton = AhoCorasick(serialized: data, keys: keys) {
+            return automaton
+        }
+        let automaton = AhoCorasick(keys: keys)
+        try? automaton.serialized().write(to: url, options: .atomic)
+        return automaton
+    }
+}
+
+/// The UTF-8 bytes of `s` with ASCII letters lowercased; other bytes, including
+/// non-ASCII ones, are copied unchanged. The loop is branch-free per byte so the
+/// compiler can vectorize it.
+func lowercasedASCII(_ s: String) -> [UInt8] {
+    var bytes = Array(s.utf8)
+    for i in bytes.indices {
+        let b = bytes[i]
+        bytes[i] = b &- 0x41 < 26 ? b | 0x20 : b
+    }
+    return bytes
+}
+
+/// Lowercased UTF-8 bytes of `s`, ready for tokenizeASCII(_:). ASCII input takes
+/// the byte fast path. Anything else is first split on Unicode non-letters
+/// (NBSP, em dashes, curly quotes...) and re-joined with ASCII spaces, so that
+/// non-ASCII bytes left in the buffer are always part of a word.
+func symptomBytes(_ s: String) -> [UInt8] {
+    if s.utf8.allSatisfy({ $0 < 0x80 }) {
+        return lowercasedASCII(s)
+    }
+    let words = s.lowercased().split { !$0.isLetter && !$0.isNumber }
+    return Array(words.joined(separator: " ").utf8)
+}
+
+/// Splits lowercased UTF-8 `bytes` into runs of ASCII letters and digits in one
+/// pass, returning slices of `bytes` rather than copies. Non-ASCII bytes count as
+/// word bytes so multi-byte letters stay inside their token; input must come from
+/// symptomBytes(_:) so that no non-ASCII separators remain.
+func tokenizeASCII(_ bytes: [UInt8]) -> [ArraySlice<UInt8>] {
+    var tokens: [ArraySlice<UInt8>] = []
+    var start: Int?
+    for (i, b) in bytes.enumerated() {
+        if b &- 0x61 < 26 || b &- 0x30 < 10 || b >= 0x80 {
+            if start == nil { start = i }
+        } else if let tokenStart = start {
+            tokens.append(bytes[tokenStart..<i])
+            start = nil
+        }
+    }
+    if let tokenStart = start {
+        tokens.append(bytes[tokenStart...])
+    }
+    return tokens
+}
+
+/// The distinct `tokens` in first-seen order, each with its number of occurrences.
+/// A 64-bit mask of hashed tokens rules out most repeats without comparing bytes;
+/// only a token whose bit is already set is checked against the earlier ones.
+func distinctTokens(_ tokens: [ArraySlice<UInt8>]) -> [(token: ArraySlice<UInt8>, count: Int)] {
+    var seenBits: UInt64 = 0
+    var distinct: [(token: ArraySlice<UInt8>, count: Int)] = []
+    distinct.reserveCapacity(tokens.count)
+    for token in tokens {
+        var hash: UInt32 = 0x811c9dc5
+        for b in token {
+            hash = (hash ^ UInt32(b)) &* 0x01000193
+        }
+        let bit: UInt64 = 1 << ((hash ^ hash >> 16) & 63)
+        if seenBits & bit != 0, let i = distinct.firstIndex(where: { $0.token == token }) {
+            distinct[i].count += 1
+            continue
+        }
+        seenBits |= bit
+        distinct.append((token, 1))
+    }
+    return distinct
+}
+
+/// Levenshtein distance between `a` and `b` if it is at most `k`, otherwise nil.
+/// Only the diagonal band of width 2k+1 is filled (Ukkonen), and the scan stops
+/// as soon as a whole row exceeds `k`.
+func editDistanceAtMost(_ a: ArraySlice<UInt8>, _ b: ArraySlice<UInt8>, _ k: Int) -> Int? {
+    let n = a.count, m = b.count
+    if abs(n - m) > k { return nil }
+    if n == 0 || m == 0 { return max(n, m) }
+
+    let inf = k + 1
+    var prev = [Int](repeating: inf, count: m + 1)
+    var cur = prev
+    for j in 0...min(m, k) { prev[j] = j }
+
+    for i in 1...n {
+        let lo = max(1, i - k), hi = min(m, i + k)
+        cur[lo - 1] = lo == 1 ? min(i, inf) : inf
+        var rowMin = cur[lo - 1]
+        for j in lo...hi {
+            let cost = a[a.startIndex + i - 1] == b[b.startIndex + j - 1] ? 0 : 1
+            let d = min(prev[j - 1] + cost, prev[j] + 1, cur[j - 1] + 1)
+            cur[j] = min(d, inf)
+            rowMin = min(rowMin, cur[j])
+        }
+        if rowMin > k { return nil }
+        swap(&prev, &cur)
+    }
+    return prev[m] <= k ? prev[m] : nil
+}
+
+// Fixed-capacity LRU cache. Eviction scans for the least recently used entry,
+// which is cheap at the small capacities used here.
+struct LRUCache<Key: Hashable, Value> {
+    let capacity: Int
+    private var entries: [Key: (value: Value, lastUsed: UInt64)] = [:]
+    private var clock: UInt64 = 0
+
+    init(capacity: Int) {
+        self.capacity = capacity
+    }
+
+    subscript(key: Key) -> Value? {
+        mutating get {
+            guard let entry = entries[key] else { return nil }
+            clock += 1
+            entries[key] = (entry.value, clock)
+            return entry.value
+        }
+        set {
+            guard let value = newValue else {
+                entries[key] = nil
+                return
+            }
+            clock += 1
+            if entries[key] == nil && entries.count >= capacity,
+               let oldest = entries.min(by: { $0.value.lastUsed < $1.value.lastUsed })?.key {
+                entries[oldest] = nil
+            }
+            entries[key] = (value, clock)
+        }
+    }
 }
 
 final class QuickTriageModel: ObservableObject {
@@ -21,8 +342,53 @@ final class QuickTriageModel: ObservableObject {
     @Published var results: [Condition] = []
     @Published var isUrgent: Bool = false
 
+    // Symptom table flattened into parallel arrays. Candidates are interned to
+    // integer ids indexing candidateNames/candidateSummaries; the ids for key k
+    // are keyCandidates[candidateOffsets[k]..<candidateOffsets[k + 1]].
+    private struct SymptomTable {
+        let keyStrings: [String]
+        let candidateOffsets: [Int]
+        let keyCandidates: [Int]
+        let candidateNames: [String]
+        let candidateSummaries: [String]
+        let fallback: [(id: Int, score: Double)]
+
+        var candidateCount: Int { candidateNames.count }
+
+        init(_ entries: KeyValuePairs<String, [(String, String)]>, fallback: [(String, Double, String)]) {
+            var keyStrings: [String] = []
+            var candidateOffsets: [Int] = [0]
+            var keyCandidates: [Int] = []
+            var candidateNames: [String] = []
+            var candidateSummaries: [String] = []
+            var ids: [String: Int] = [:]
+
+            func intern(_ name: String, _ summary: String) -> Int {
+                if let id = ids[name] { return id }
+                ids[name] = candidateNames.count
+                candidateNames.append(name)
+                candidateSummaries.append(summary)
+                return candidateNames.count - 1
+            }
+
+            for (key, candidates) in entries {
+                keyStrings.append(key)
+                for (name, summary) in candidates {
+                    keyCandidates.append(intern(name, summary))
+                }
+                candidateOffsets.append(keyCandidates.count)
+            }
+            self.fallback = fallback.map { (intern($0.0, $0.2), $0.1) }
+            self.keyStrings = keyStrings
+            self.candidateOffsets = candidateOffsets
+            self.keyCandidates = keyCandidates
+            self.candidateNames = candidateNames
+            self.candidateSummaries = candidateSummaries
+        }
+    }
+
     // Tiny symptom -> candidate map
-    private let symptomMap: [String: [(String, String)]] = [
+    private static let symptoms = SymptomTable([
         "fever": [("Influenza", "Common viral infection causing fever and body aches."),
                   ("COVID-19", "May cause fever, cough, and fatigue.")],
         "cough": [("Common Cold", "Usually mild; cough, runny nose."),
@@ -36,61 +402,169 @@ final class QuickTriageModel: ObservableObject {
                                 ("Pneumonia", "Infection causing cough and breathing difficulty.")],
         "abdominal pain": [("Appendicitis", "Localized severe pain — seek care if severe."),
                            ("Gastritis", "Stomach inflammation causing pain.")]
-    ]
+    ], fallback: [
+        // If nothing matched, provide generic suggestions
+        ("Viral infection", 0.5, "Symptoms may be viral; rest, fluids, and re-evaluate if worsening."),
+        ("Non-specific symptoms", 0.3, "Symptoms are non-specific; follow-up recommended.")
+    ])
 
-    func diagnose() {
-        let tokens = symptomsText
-            .lowercased()
-            .split { !$0.isLetter && !$0.isNumber }
-            .map(String.init)
-            .filter { !$0.isEmpty }
+    // Red-flag words for checkUrgent(flags:age:), bit i for redFlagWords[i]. The
+    // automaton matches them as whole tokens by padding them with spaces.
+    private static let redFlagWords = ["chest", "pain", "shortness", "breath", "faint", "unconscious"]
 
-        var scores: [String: Double] = [:]
-        var summaries: [String: String] = [:]
+    // Loaded (or built and cached) once, on first diagnose(). Key ids below
+    // symptoms.keyStrings.count are symptoms; the rest are red-flag words in order.
+    private static let symptomAutomaton = AhoCorasick.cached(
+        keys: symptoms.keyStrings + redFlagWords.map { " \($0) " },
+        at: FileManager.default.urls(for: .cachesDirectory, in: .userDomainMask).first?
+            .appendingPathComponent("symptom-automaton.bin"))
 
-        for token in tokens {
-            for (key, candidates) in symptomMap {
-                if token.contains(key) || key.contains(token) || token == key {
-                    for (name, summary) in candidates {
-                        scores[name, default: 0.0] += 1.0
-                        summaries[name] = summary
-                    }
-                }
+    // Single-word keys, matched against tokens with one edit of tolerance. Keys
+    // shorter than 6 bytes only accept an insertion or deletion: one substitution
+    // turns "fever" into "never" or "fewer" and "cough" into "rough" or "couch".
+    private static let fuzzyKeys: [(id: Int, key: ArraySlice<UInt8>)] = symptoms.keyStrings.enumerated()
+        .filter { !$0.element.contains(" ") }
+        .map { ($0.offset, ArraySlice($0.element.utf8)) }
+
+    // Serial background queue for evaluate(); it is the only user of diagCache
+    private let diagnoseQueue = DispatchQueue(label: "QuickTriageModel.diagnose", qos: .userInitiated)
+
+    // Recent diagnoses keyed by cacheKey(tokens:age:sex:); symptoms is static, so never invalidated
+    private var diagCache = LRUCache<UInt64, (results: [Condition], urgent: Bool)>(capacity: 64)
+
+    // Bumped on the main thread by every diagnose(); only the latest request publishes
+    private var requestId: UInt64 = 0
+
+    func diagnose() {
+        requestId += 1
+        let id = requestId
+        let text = symptomsText, age = self.age, sex = self.sex
+
+        diagnoseQueue.async {
+            let diagnosis = self.evaluate(text: text, age: age, sex: sex)
+            DispatchQueue.main.async {
+                guard id == self.requestId else { return }
+                self.results = diagnosis.results
+                self.isUrgent = diagnosis.urgent
             }
         }
+    }
 
-        // If nothing matched, provide generic suggestions
-        if scores.isEmpty {
-            scores["Viral infection"] = 0.5
-            summaries["Viral infection"] = "Symptoms may be viral; rest, fluids, and re-evaluate if worsening."
-            scores["Non-specific symptoms"] = 0.3
-            summaries["Non-specific symptoms"] = "Symptoms are non-specific; follow-up recommended."
+    // Resets the input and results, and drops any diagnosis still in flight.
+    func clear() {
+        requestId += 1
+        symptomsText = ""
+        results = []
+        isUrgent = false
+    }
+
+    private func evaluate(text: String, age: Int, sex: String) -> (results: [Condition], urgent: Bool) {
+        let tokens = tokenizeASCII(symptomBytes(text))
+
+        let cacheKey = Self.cacheKey(tokens: tokens, age: age, sex: sex)
+        if let cached = diagCache[cacheKey] {
+            return cached
         }
 
-        // Normalize and create top 3 results
-        let maxScore = scores.values.max() ?? 1.0
-        let sorted = scores.sorted { $0.value > $1.value }.prefix(3)
+        let table = Self.symptoms
+        let (ranked, redFlags) = Self.rankCandidates(tokens)
+        let top = ranked.isEmpty ? table.fallback : ranked
+
+        // Normalize and create results
+        let maxScore = top[0].score
         var conditions: [Condition] = []
-        for (name, score) in sorted {
+        for (id, score) in top {
             // map 0..maxScore to 0.4..0.95
             let conf = min(0.95, 0.4 + (score / maxScore) * 0.55)
-            conditions.append(Condition(name: name, confidence: conf, summary: summaries[name] ?? ""))
+            conditions.append(Condition(name: table.candidateNames[id], confidence: conf,
+                                        summary: table.candidateSummaries[id]))
         }
-        DispatchQueue.main.async {
-            self.results = conditions
-            self.isUrgent = checkUrgent(tokens: tokens)
+        let urgent = checkUrgent(flags: redFlags, age: age)
+        diagCache[cacheKey] = (conditions, urgent)
+        return (conditions, urgent)
+    }
+
+    // Scoring kernel: automaton scan, typo pass and top-3 selection over the byte
+    // tokens, also collecting red-flag bits from the same scan. Scores live in a
+    // stack buffer indexed by candidate id.
+    private static func rankCandidates(_ tokens: [ArraySlice<UInt8>]) -> (top: [(id: Int, score: Double)], redFlags: UInt8) {
+        let table = symptoms
+        let symptomKeyCount = table.keyStrings.count
+        return withUnsafeTemporaryAllocation(of: Double.self, capacity: table.candidateCount) { scores in
+            scores.initialize(repeating: 0.0)
+            func credit(key k: Int, times: Int = 1) {
+                for j in table.candidateOffsets[k]..<table.candidateOffsets[k + 1] {
+                    scores[table.keyCandidates[j]] += Double(times)
+                }
+            }
+
+            // Scan the normalized token text, so the result depends only on the cache
+            // key. It is space-padded so red-flag words match at either end.
+            var text: [UInt8] = [0x20]
+            for token in tokens {
+                text += token
+                text.append(0x20)
+            }
+            var redFlags: UInt8 = 0
+            symptomAutomaton.scan(text) { k in
+                if k < symptomKeyCount {
+                    credit(key: k)
+                } else {
+                    redFlags |= 1 << (k - symptomKeyCount)
+                }
+            }
+
+            // Typo tolerance ("feaver", "fevr", "nausia"). Exact hits and a key plus one
+            // extra leading/trailing letter ("coughs") were already counted by the scan.
+            // Repeated tokens are checked once and credited per occurrence.
+            for (token, count) in distinctTokens(tokens) {
+                for (k, key) in fuzzyKeys {
+                    if key.count < 6 && token.count == key.count { continue }
+                    guard let d = editDistanceAtMost(token, key, 1), d > 0 else { continue }
+                    if token.count > key.count && (token.starts(with: key) || token.suffix(key.count).elementsEqual(key)) {
+                        continue
+                    }
+                    credit(key: k, times: count)
+                }
+            }
+
+            // Keep the three best candidates in one pass, best first
+            var top: [(id: Int, score: Double)] = []
+            top.reserveCapacity(3)
+            for id in scores.indices where scores[id] > 0 {
+                guard top.count < 3 || scores[id] > top[2].score else { continue }
+                if top.count == 3 { top.removeLast() }
+                var slot = top.count
+                while slot > 0 && top[slot - 1].score < scores[id] { slot -= 1 }
+                top.insert((id, scores[id]), at: slot)
+            }
+            return (top, redFlags)
         }
     }
 
-    private func checkUrgent(tokens: [String]) -> Bool {
-        let t = Set(tokens)
+    // 64-bit FNV-1a over the normalized token sequence, age and sex
+    private static func cacheKey(tokens: [ArraySlice<UInt8>], age: Int, sex: String) -> UInt64 {
+        var hash: UInt64 = 0xcbf29ce484222325
+        func mix(_ byte: UInt8) {
+            hash = (hash ^ UInt64(byte)) &* 0x100000001b3
+        }
+        for token in tokens {
+            token.forEach(mix)
+            mix(0x20)
+        }
+        mix(0)
+        withUnsafeBytes(of: age.littleEndian) { $0.forEach(mix) }
+        sex.utf8.forEach(mix)
+        return hash
+    }
+
+    private func checkUrgent(flags: UInt8, age: Int) -> Bool {
         // deterministic red-flag checks
-        if t.contains("chest") && t.contains("pain") { return true }
-        if t.contains("shortness") && t.contains("breath") { return true }
-        if t.contains("faint") || t.contains("unconscious") { return true }
-        // age-based example: older patients with breathlessness
-        if age > 75 && (t.contains("breath") || t.contains("shortness")) { return true }
-        return false
+        (flags & 0b000011 == 0b000011)      // chest + pain
+            || (flags & 0b001100 == 0b001100)   // shortness + breath
+            || (flags & 0b110000 != 0)          // faint / unconscious
+            // age-based example: older patients with breathlessness
+            || (age > 75 && flags & 0b001100 != 0)
     }
 }
 
@@ -136,21 +610,7 @@ struct ContentView: View {
     }
 
     private var header: some View {
-        HStack {
-            VStack(alignment: .leading) {
-                Text("Quick Triage")
-                    .font(.largeTitle).bold()
-                Text("Enter symptoms and get quick possible causes")
-                    .font(.subheadline)
-                    .opacity(0.9)
-            }
-            Spacer()
-            Circle()
-                .fill(Color.white.opacity(0.2))
-                .frame(width: 56, height: 56)
-                .overlay(Image(systemName: "stethoscope").foregroundColor(.white))
-        }
-        .padding(.horizontal, 6)
+        HeaderView().equatable()
     }
 
     private var formCard: some View {
@@ -218,19 +678,7 @@ struct ContentView: View {
                     }
                 }
                 ForEach(model.results) { c in
-                    HStack {
-                        VStack(alignment: .leading, spacing: 6) {
-                            Text(c.name).bold()
-                            Text(c.summary).font(.caption)
-                                .foregroundColor(.white.opacity(0.9))
-                        }
-                        Spacer()
-                        Text("\(Int(c.confidence * 100))%")
-                            .font(.headline)
-                    }
-                    .padding()
-                    .background(Color.white.opacity(0.08))
-                    .cornerRadius(12)
+                    ResultRow(condition: c).equatable()
                 }
                 if model.isUrgent {
                     Button(action: { showingHelp = true }) {
@@ -252,25 +700,76 @@ struct ContentView: View {
     }
 
     private var footer: some View {
+        FooterView(onClear: {
+            withAnimation { model.clear() }
+        })
+        .equatable()
+    }
+}
+
+// The subviews below are Equatable so SwiftUI skips them when their inputs are unchanged.
+
+struct HeaderView: View, Equatable {
+    var body: some View {
+        HStack {
+            VStack(alignment: .leading) {
+                Text("Quick Triage")
+                    .font(.largeTitle).bold()
+                Text("Enter symptoms and get quick possible causes")
+                    .font(.subheadline)
+                    .opacity(0.9)
+            }
+            Spacer()
+            Circle()
+                .fill(Color.white.opacity(0.2))
+                .frame(width: 56, height: 56)
+                .overlay(Image(systemName: "stethoscope").foregroundColor(.white))
+        }
+        .padding(.horizontal, 6)
+    }
+}
+
+struct ResultRow: View, Equatable {
+    let condition: Condition
+
+    var body: some View {
+        HStack {
+            VStack(alignment: .leading, spacing: 6) {
+                Text(condition.name).bold()
+                Text(condition.summary).font(.caption)
+                    .foregroundColor(.white.opacity(0.9))
+            }
+            Spacer()
+            Text(condition.confidenceText)
+                .font(.headline)
+        }
+        .padding()
+        .background(Color.white.opacity(0.08))
+        .cornerRadius(12)
+    }
+}
+
+struct FooterView: View, Equatable {
+    let onClear: () -> Void
+
+    var body: some View {
         HStack {
             Text("Not a medical diagnosis. For emergency call local services.")
                 .font(.footnote)
                 .opacity(0.95)
             Spacer()
-            Button(action: {
-                // clear
-                withAnimation {
-                    model.symptomsText = ""
-                    model.results = []
-                    model.isUrgent = false
-                }
-            }) {
+            Button(action: onClear) {
                 Image(systemName: "trash")
             }
             .buttonStyle(.borderless)
         }
         .padding(.horizontal, 4)
     }
+
+    // The footer's content is static; onClear always targets the same model.
+    static func == (lhs: FooterView, rhs: FooterView) -> Bool {
+        true
+    }
 }
 
 // Small blur helper (uses UIKit's UIVisualEffectView)